@@ -1,26 +1,41 @@
 #!/usr/bin/env python3
 import argparse
+import array
+import atexit
 import csv
+import functools
+import importlib
+import importlib.util
 import os
 import re
 import sys
-from datetime import datetime
-import textwrap
+import time
 import shutil
 
 # -------- Optional Rich UI --------
+# Only check that rich is installed here; its modules are imported on first use
 HAVE_RICH = False
 if os.environ.get("NO_COLOR", "").lower() not in {"1", "true", "yes"}:
     try:
-        from rich.console import Console
-        from rich.panel import Panel
-        from rich.text import Text
-        from rich.prompt import Prompt
-        from rich.theme import Theme
-        HAVE_RICH = True
+        HAVE_RICH = importlib.util.find_spec("rich") is not None
     except Exception:
         HAVE_RICH = False
 
+# -------- Optional Aho-Corasick keyword scanner --------
+HAVE_AHOCORASICK = False
+try:
+    import ahocorasick
+    HAVE_AHOCORASICK = True
+except Exception:
+    HAVE_AHOCORASICK = False
+# Below this many plain-word keywords one regex pass beats automaton + residual regex
+AHOCORASICK_MIN_LITERALS = 24
+
+# -------- Optional regex engines --------
+# "regex" is a faster drop-in for large alternations; "re2" (google-re2) is a linear-time DFA.
+# Both are imported only when selected with --regex-engine.
+ENGINE_PACKAGES = {"re": "re", "regex": "regex", "re2": "google-re2"}
+
 # -------- Reasons & required columns --------
 REASONS = {
     "1": "non-paper",
@@ -29,7 +44,8 @@ REASONS = {
     "4": "not auditing OF AI",
     "5": "other",  # asks for details; stores just "other"
 }
-REQUIRED_COLUMNS = ["Document Type", "Article Title", "Abstract"]
+# Interned like WorkRows.fieldnames, so row lookups by these names hit on identity
+REQUIRED_COLUMNS = [sys.intern(c) for c in ("Document Type", "Article Title", "Abstract")]
 
 # -------- ANSI fallback (when Rich not present) --------
 ANSI = {
@@ -47,6 +63,8 @@ def supports_ansi():
         return sys.stdout.isatty()
     except Exception:
         return False
+_ANSI_OK = supports_ansi()
+_ANSI_KEYWORD_ON = ANSI["yellow"] + ANSI["bold"]
 
 # -------- CSV helpers --------
 def validate_columns(fieldnames, need_include_reason=False):
@@ -63,61 +81,442 @@ def validate_columns(fieldnames, need_include_reason=False):
                     f"ERROR: Working file is missing '{c}'. Use --from-scratch to rebuild."
                 )
 
-def read_csv(path, encoding="utf-8"):
+def read_fieldnames(path, encoding="utf-8"):
     with open(path, "r", encoding=encoding, newline="") as f:
-        reader = csv.DictReader(f)
-        return reader.fieldnames or [], list(reader)
+        return csv.DictReader(f).fieldnames or []
 
-def write_csv(path, fieldnames, rows, encoding="utf-8"):
+def iter_records(path, encoding="utf-8"):
+    """Yield the data records of a CSV file as lists, padded/cut to the header's width."""
+    with open(path, "r", encoding=encoding, newline="") as f:
+        reader = csv.reader(f)
+        width = len(next(reader, []))
+        for rec in reader:
+            if not rec:  # blank line, skipped like DictReader does
+                continue
+            if len(rec) != width:
+                rec = (rec + [""] * width)[:width]
+            yield rec
+
+def _fsync_dir(path):
+    # Makes a rename in this directory durable; not possible (or needed) on every platform
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def write_csv(path, fieldnames, records, encoding="utf-8", durable=False):
+    """Write records (lists in fieldnames order) to path atomically; return the row count.
+
+    Records are positional, so there is no per-row dict-to-list mapping as with DictWriter.
+    With durable=True the data is fsynced before the rename and the rename after it.
+    """
     tmp = path + ".tmp"
+    count = 0
     with open(tmp, "w", encoding=encoding, newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        for rec in records:
+            writer.writerow(rec)
+            count += 1
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
     os.replace(tmp, path)
+    if durable:
+        _fsync_dir(path)
+    return count
+
+def rewrite_work(path, fieldnames, decisions, encoding="utf-8", durable=False):
+    """Stream the working copy through, applying {row_index: (include, reason)}."""
+    inc, rea = fieldnames.index("include"), fieldnames.index("reason")
+    def updated():
+        for idx, rec in enumerate(iter_records(path, encoding)):
+            if idx in decisions:
+                rec[inc], rec[rea] = decisions[idx]
+            yield rec
+    write_csv(path, fieldnames, updated(), encoding, durable)
 
 def init_or_load_work(input_csv, work_csv, encoding, from_scratch=False):
     if os.path.exists(work_csv) and not from_scratch:
-        flds, rows = read_csv(work_csv, encoding)
+        flds = read_fieldnames(work_csv, encoding)
         validate_columns(flds, need_include_reason=True)
-        return flds, rows
-    in_fields, in_rows = read_csv(input_csv, encoding)
+        return flds
+    in_fields = read_fieldnames(input_csv, encoding)
     validate_columns(in_fields)
     out_fields = list(in_fields)
     if "include" not in out_fields:
         out_fields.append("include")
     if "reason" not in out_fields:
         out_fields.append("reason")
-    for r in in_rows:
-        r.setdefault("include", "")
-        r.setdefault("reason", "")
-    write_csv(work_csv, out_fields, in_rows, encoding)
-    print(f"Created working copy: {work_csv} ({len(in_rows)} rows)")
-    return out_fields, in_rows
+    # Stream input -> working copy; the added include/reason columns start empty
+    extra = [""] * (len(out_fields) - len(in_fields))
+    count = write_csv(work_csv, out_fields, (rec + extra for rec in iter_records(input_csv, encoding)), encoding)
+    print(f"Created working copy: {work_csv} ({count} rows)")
+    return out_fields
+
+# One byte per row in WorkRows.status
+DECIDED_CODES = {"yes": ord("y"), "no": ord("n")}
+UNDECIDED = ord("?")
+
+class WorkRows:
+    """Random access to working-copy rows through a record-offset index.
+
+    One pass records where each CSV record starts (records may span several
+    lines) and a one-byte decision status per row; rows are then parsed on demand.
+    """
+
+    def __init__(self, path, encoding="utf-8"):
+        self.encoding = encoding
+        # Binary reads keep tell() cheap; encodings that can't split on b"\n" (UTF-16...) use text mode
+        try:
+            self.binary = b"\n".decode(encoding) == "\n"
+        except UnicodeDecodeError:
+            self.binary = False
+        if self.binary:
+            # Binary readline only splits on b"\n"; old Mac-style CR-only files need text mode
+            with open(path, "rb") as f:
+                self.binary = b"\r" not in f.readline(1 << 16).replace(b"\r\n", b"")
+        self.f = open(path, "rb") if self.binary else open(path, "r", encoding=encoding, newline="")
+        records = self._records()
+        _, header = next(records, (0, []))
+        # Interned, so the row dicts built by __getitem__ key on the same objects as REQUIRED_COLUMNS
+        self.fieldnames = [sys.intern(c) for c in header]
+        inc = header.index("include")
+        # Text-mode tell() returns opaque cookies that may not fit in 64 bits
+        self.offsets = array.array("q") if self.binary else []
+        self.status = bytearray()
+        for offset, rec in records:
+            self.offsets.append(offset)
+            self.status.append(DECIDED_CODES.get((rec[inc] if inc < len(rec) else "").strip(), UNDECIDED))
+        self.undecided = array.array("i")
+        i = self.status.find(UNDECIDED)
+        while i != -1:
+            self.undecided.append(i)
+            i = self.status.find(UNDECIDED, i + 1)
+
+    def _records(self):
+        # csv.reader never reads ahead, so tell() before each record is its start
+        reader = csv.reader(self._lines())
+        while True:
+            offset = self.f.tell()
+            rec = next(reader, None)
+            if rec is None:
+                return
+            if rec:  # skip blank lines, like DictReader
+                yield offset, rec
+
+    def _lines(self):
+        if self.binary:
+            return (line.decode(self.encoding) for line in iter(self.f.readline, b""))
+        return iter(self.f.readline, "")
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, idx):
+        self.f.seek(self.offsets[idx])
+        rec = next(csv.reader(self._lines()))
+        return dict(zip(self.fieldnames, rec + [""] * (len(self.fieldnames) - len(rec))))
+
+    def close(self):
+        self.f.close()
+
+# -------- Decision journal --------
+JOURNAL_FIELDS = ["row_index", "include", "reason", "ts"]
+
+def journal_path(work_csv):
+    return os.path.splitext(work_csv)[0] + ".journal.csv"
+
+def replay_journal(path, encoding="utf-8"):
+    """Read decisions left in a journal (e.g. after a crash) as {row_index: (include, reason)}."""
+    decisions = {}
+    if not os.path.exists(path):
+        return decisions
+    with open(path, "r", encoding=encoding, newline="") as f:
+        for j in csv.DictReader(f):
+            if j.get("ts") is None:  # torn last line
+                continue
+            try:
+                idx = int(j["row_index"])
+            except (TypeError, ValueError):
+                continue
+            decisions[idx] = (j["include"], j["reason"])
+    return decisions
+
+@functools.lru_cache(maxsize=1)
+def _format_utc(second):
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+
+def utc_timestamp():
+    # ISO-8601 UTC to the second; formatted at most once per second
+    return _format_utc(int(time.time()))
+
+def open_journal(path, encoding="utf-8"):
+    f = open(path, "w", encoding=encoding, newline="")
+    writer = csv.writer(f)
+    writer.writerow(JOURNAL_FIELDS)
+    f.flush()
+    return f, writer
 
 # -------- Keyword building --------
-def build_keyword_patterns(user_keywords):
-    defaults = [
-        "audit*", "fair*", "priva*", "explain*", "interpret*", "transparent*",
-        "AI", "machine learning", "data mining",
-    ]
-    terms = defaults + (user_keywords or [])
-    pats = []
+def _term_pattern(t):
+    p = re.escape(t).replace(r"\*", r"\w*").replace(r"\ ", r"\s+")
+    return rf"\b{p}\b"
+
+def _is_word_char(c):
+    return c.isalnum() or c == "_"
+
+def _one_word(t):
+    # "fair" and "fair*" always match exactly one whole word, whatever else is in the list
+    body = t[:-1] if t.endswith("*") else t
+    return bool(body) and all(map(_is_word_char, body))
+
+def _is_literal_term(t):
+    # Plain single-word terms whose \b anchors reduce to "no word char on either side"
+    return "*" not in t and _one_word(t)
+
+def _shadows(t, p):
+    """Whether term t can match where word-prefix p does but end elsewhere ("machine learning" vs p="machine")."""
+    if _one_word(t):
+        return False
+    head = t.lower().split("*")[0]
+    return head.startswith(p) or ("*" in t and p.startswith(head))
+
+def _is_prefix_term(t):
+    # "prefix*" terms all end in the same \w*\b tail, so their prefixes can share one trie
+    return t.endswith("*") and t.count("*") == 1 and len(t) > 1 and _is_word_char(t[0]) \
+        and not any(c.isspace() for c in t)
+
+def _trie_pattern(node):
+    # A terminal node is followed by \w* anyway, so only non-word continuations still matter
+    items = [(ch, child) for ch, child in sorted(node.items())
+             if ch and not ("" in node and _is_word_char(ch))]
+    alts = [re.escape(ch) + _trie_pattern(child) for ch, child in items]
+    if not alts:
+        return ""
+    body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+    return f"(?:{body})?" if "" in node else body
+
+@functools.lru_cache(maxsize=None)
+def _prefix_group(prefixes):
+    r"""Factor wildcard prefixes into one pattern, e.g. ("fair", "fame") -> \bfa(?:ir|me)\w*\b."""
+    trie = {}
+    for p in prefixes:
+        node = trie
+        for ch in p:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    return rf"\b{_trie_pattern(trie)}\w*\b"
+
+def _alternation(terms):
+    # Alternatives keep their listed order, since the first one that matches wins. Word prefixes
+    # share one trie in the slot of the first; one an earlier term can shadow keeps its own slot.
+    pats, group, others = [], [], []
     for t in terms:
-        t = t.strip()
-        if not t:
+        if _is_prefix_term(t) and _one_word(t) and not any(_shadows(o, t[:-1].lower()) for o in others):
+            if not group:
+                pats.append(None)
+            group.append(t[:-1].lower())
+        else:
+            others.append(t)
+            pats.append(_term_pattern(t))
+    if group:
+        pats[pats.index(None)] = _prefix_group(tuple(sorted(set(group))))
+    return "|".join(pats)
+
+def compile_pattern(pattern, engine="re", ascii=False):
+    # RE2 classes (\w, \s, \b) are always ASCII-only, so it needs no flag
+    if engine == "re":
+        return re.compile(pattern, re.ASCII if ascii else 0)
+    try:
+        mod = importlib.import_module(engine)
+    except ImportError:
+        raise SystemExit(
+            f"ERROR: --regex-engine {engine} needs the '{ENGINE_PACKAGES[engine]}' package installed."
+        )
+    if engine == "regex":
+        return mod.compile(pattern, mod.VERSION1 | (mod.ASCII if ascii else 0))
+    return mod.compile(pattern)
+
+class KeywordMatcher:
+    """Finds keyword spans: literal terms via Aho-Corasick (if installed), the rest via regex.
+
+    When all terms are ASCII, ASCII input is lowercased once and scanned by
+    case-sensitive ASCII patterns, which avoids Unicode case folding per character.
+    """
+
+    def __init__(self, terms, engine="re"):
+        # Automaton hits are merged with the regex's, so a literal goes there only if no other
+        # term could claim a different span from the same start
+        literals = [t for t in terms if _is_literal_term(t) and not any(_shadows(o, t.lower()) for o in terms)] \
+            if HAVE_AHOCORASICK else []
+        if len(literals) < AHOCORASICK_MIN_LITERALS:
+            literals = []
+        residual = _alternation([t for t in terms if t not in literals])
+        # \b\B never matches; unlike a lookahead it is understood by every engine
+        everything = _alternation(terms) or r"\b\B"
+        self.fallback = compile_pattern(rf"(?i)({everything})", engine)
+        self.regex = compile_pattern(rf"(?i)({residual})", engine) if residual else None
+        self.ascii_fallback = self.ascii_regex = None
+        if all(t.isascii() for t in terms):
+            lowered = [t.lower() for t in terms]
+            ascii_residual = _alternation([t for t in lowered if t not in {x.lower() for x in literals}])
+            self.ascii_fallback = compile_pattern(f"({_alternation(lowered) or everything})", engine, ascii=True)
+            if ascii_residual:
+                self.ascii_regex = compile_pattern(f"({ascii_residual})", engine, ascii=True)
+        self.automaton = None
+        if literals:
+            self.automaton = ahocorasick.Automaton()
+            for t in literals:
+                self.automaton.add_word(t.lower(), len(t))
+            self.automaton.make_automaton()
+
+    def spans(self, s):
+        """Return sorted, non-overlapping (start, end) keyword spans in s."""
+        # ASCII lowercasing keeps offsets, so spans found in low apply to s unchanged
+        if self.ascii_fallback is not None and s.isascii():
+            low, fallback, residual = s.lower(), self.ascii_fallback, self.ascii_regex
+        else:
+            low, fallback, residual = None, self.fallback, self.regex
+        if self.automaton is None:
+            return [m.span() for m in fallback.finditer(low if low is not None else s)]
+        if low is None:
+            low = s.lower()
+            if len(low) != len(s):
+                # Lowercasing shifted offsets (rare non-ASCII case); scan everything with regex
+                return [m.span() for m in fallback.finditer(s)]
+            # Case-insensitive patterns run on the original text
+            residual_text = s
+        else:
+            residual_text = low
+        n = len(s)
+        found = []
+        for last, length in self.automaton.iter(low):
+            start, end = last - length + 1, last + 1
+            if (start == 0 or not _is_word_char(s[start - 1])) and (end == n or not _is_word_char(s[end])):
+                found.append((start, end))
+        if residual is not None:
+            found.extend(m.span() for m in residual.finditer(residual_text))
+        found.sort()
+        spans = []
+        for start, end in found:
+            if spans and start < spans[-1][1]:
+                if end > spans[-1][1]:
+                    spans[-1] = (spans[-1][0], end)
+            else:
+                spans.append((start, end))
+        return spans
+
+DEFAULT_KEYWORDS = [
+    "audit*", "fair*", "priva*", "explain*", "interpret*", "transparent*",
+    "AI", "machine learning", "data mining",
+]
+
+def build_keyword_patterns(user_keywords, engine="re"):
+    defaults = list(DEFAULT_KEYWORDS)
+    terms = [t.strip() for t in defaults + (user_keywords or []) if t.strip()]
+    return KeywordMatcher(terms, engine), defaults, user_keywords or []
+
+def min_keyword_length(terms):
+    # Shortest text any term can match ('*' may match nothing, spaces need >= 1 char)
+    lens = [len(t.strip().replace("*", "")) for t in terms if t.strip()]
+    return min(lens) if lens else 0
+
+# Keywords can't match across this: it is neither a word nor a whitespace character
+FIELD_SEP = "\x00" * 8
+
+def field_spans(matcher, fields, min_len=0):
+    """Scan several fields with one matcher call; return a list of (start, end) spans per field.
+
+    Fields shorter than the shortest keyword are left out of the scan.
+    """
+    per_field = [[] for _ in fields]
+    scanned = [i for i, f in enumerate(fields) if f and len(f) >= min_len]
+    if not scanned:
+        return per_field
+    bases = []
+    pos = 0
+    for i in scanned:
+        bases.append(pos)
+        pos += len(fields[i]) + len(FIELD_SEP)
+    k = 0
+    for start, end in matcher.spans(FIELD_SEP.join(fields[i] for i in scanned)):
+        while k + 1 < len(bases) and start >= bases[k + 1]:
+            k += 1
+        per_field[scanned[k]].append((start - bases[k], end - bases[k]))
+    return per_field
+
+# Rows scanned ahead per precompute_spans call; keeps startup instant on huge files
+SPAN_BATCH = 500
+
+def precompute_spans(rows, indices, matcher, min_len=0):
+    """Scan a batch of rows that will be shown, ahead of rendering.
+
+    Returns {row_index: (row, array of (field, start, end) triples)} over REQUIRED_COLUMNS,
+    so rendering never has to run the matcher or parse the row again.
+    """
+    batch = {}
+    for idx in indices:
+        r = rows[idx]
+        flat = array.array("i")
+        fields = [r.get(c, "") or "" for c in REQUIRED_COLUMNS]
+        for f, spans in enumerate(field_spans(matcher, fields, min_len)):
+            for start, end in spans:
+                flat.extend((f, start, end))
+        batch[idx] = (r, flat)
+    return batch
+
+def unpack_spans(flat):
+    """Per-field (start, end) lists from a precompute_spans entry."""
+    per_field = [[] for _ in REQUIRED_COLUMNS]
+    for i in range(0, len(flat), 3):
+        per_field[flat[i]].append((flat[i + 1], flat[i + 2]))
+    return per_field
+
+# -------- Auto-decision prepass --------
+def auto_decide(rows, indices, exclude_doctypes, must_have):
+    """Decide obvious rows without prompting; return {row_index: (include, reason)}.
+
+    Rows with a Document Type component in exclude_doctypes ({lowercased type: reason})
+    are excluded with that reason; rows whose title or abstract matches every must_have
+    pattern are included.
+    """
+    dt_col, title_col, abstract_col = REQUIRED_COLUMNS
+    auto = {}
+    for idx in indices:
+        r = rows[idx]
+        types = (t.strip().lower() for t in (r.get(dt_col) or "").split(";"))
+        reason = next((exclude_doctypes[t] for t in types if t in exclude_doctypes), None)
+        if reason is not None:
+            auto[idx] = ("no", reason)
             continue
-        p = re.escape(t).replace(r"\*", r"\w*").replace(r"\ ", r"\s+")
-        pats.append(rf"\b{p}\b")
-    if not pats:
-        pats = [r"(?!x)x"]
-    return re.compile(rf"(?i)({'|'.join(pats)})"), defaults, user_keywords or []
+        if must_have:
+            text = FIELD_SEP.join((r.get(title_col) or "", r.get(abstract_col) or ""))
+            if all(p.search(text) for p in must_have):
+                auto[idx] = ("yes", "")
+    return auto
 
 # -------- Rich render helpers --------
 def make_console(theme_name):
+    """Rich console for theme_name, or None if rich is missing or fails to import."""
+    global HAVE_RICH
     if not HAVE_RICH:
         return None
+    # First import of rich; a broken install falls back to ANSI like a missing one.
+    # The modules used later are imported here too, so their lazy imports can't fail.
+    try:
+        from rich.console import Console
+        from rich.theme import Theme
+        import rich.panel, rich.prompt, rich.text  # noqa: F401
+    except Exception:
+        HAVE_RICH = False
+        return None
     if theme_name == "high-contrast":
         theme = Theme({
             "hdr": "bold white on blue",
@@ -154,34 +553,51 @@ def make_console(theme_name):
     # soft_wrap=True ensures Rich never truncates long lines; it wraps instead
     return Console(theme=theme, highlight=False, soft_wrap=True)
 
-def text_with_keyword_style(s, matcher, keyword_style):
+def text_with_keyword_style(s, spans, keyword_style):
+    if not s:
+        return ""
     if not HAVE_RICH:
-        return s or ""
+        return s
+    from rich.text import Text
     # Explicitly disable truncation & allow wrapping
-    t = Text(s or "", no_wrap=False, overflow="fold", end="")
-    for m in matcher.finditer(s or ""):
-        t.stylize(keyword_style, m.start(), m.end())
+    t = Text(s, no_wrap=False, overflow="fold", end="")
+    for start, end in spans:
+        t.stylize(keyword_style, start, end)
     return t
 
-def show_record_rich(console, idx, x, total, doc_type, title, abstract, matcher, width):
+def show_record_rich(console, idx, x, total, doc_type, title, abstract, spans, width):
+    from rich.panel import Panel
     console.rule(f"[hdr]Row #{idx} • Progress: [{x} / {total}][/]")
-    dt = text_with_keyword_style(doc_type, matcher, "keyword")
-    tt = text_with_keyword_style(title, matcher, "keyword")
-    ab = text_with_keyword_style(abstract, matcher, "keyword")
+    if not (doc_type.strip() or title.strip() or abstract.strip()):
+        console.print("[dim](empty record: no document type, title or abstract)[/]")
+        return
+    dt_spans, tt_spans, ab_spans = spans
+    dt = text_with_keyword_style(doc_type, dt_spans, "keyword")
+    tt = text_with_keyword_style(title, tt_spans, "keyword")
+    ab = text_with_keyword_style(abstract, ab_spans, "keyword")
 
     # Let panels expand to full width; no artificial width cap unless user requested one
     panel_kwargs = {"border_style": "border", "expand": True}
     if width and width > 0:
         panel_kwargs["width"] = min(width, console.width - 2)
 
-    console.print(Panel(dt, title="[label]Document Type[/]", **panel_kwargs))
-    console.print(Panel(tt, title="[label]Article Title[/]", **panel_kwargs))
-    console.print(Panel(ab, title="[label]Abstract[/]", **panel_kwargs))
+    # Empty fields get a one-line note instead of a full Panel layout
+    for value, text, label, missing in (
+        (doc_type, dt, "Document Type", "no document type"),
+        (title, tt, "Article Title", "no title"),
+        (abstract, ab, "Abstract", "no abstract"),
+    ):
+        if value.strip():
+            console.print(Panel(text, title=f"[label]{label}[/]", **panel_kwargs))
+        else:
+            console.print(f"[dim]({missing})[/]")
 
 def prompt_choice_rich(console):
+    from rich.prompt import Prompt
     return Prompt.ask("[prompt](i)nclude, (e)xclude, (s)kip, (q)uit?[/]", choices=["i","e","s","q"])
 
 def prompt_reason_rich(console):
+    from rich.prompt import Prompt
     console.print("\n[prompt]Exclusion reason[/]:")
     for k in sorted(REASONS.keys(), key=int):
         console.print(f"  [label]{k})[/] {REASONS[k]}")
@@ -192,28 +608,65 @@ def prompt_reason_rich(console):
     return label
 
 # -------- Fallback print/prompts --------
-def wrap_ansi(text, matcher, width, highlight=True):
+def wrap_words(s, width):
+    """Greedy word wrap: textwrap.wrap without its per-call TextWrapper and regex chunking.
+
+    Splits on single spaces so runs of spaces inside a line are kept, drops
+    whitespace at line breaks and chops words longer than width.
+    """
+    lines = []
+    line = ""
+    for word in s.expandtabs().split(" "):
+        if line and len(line) + 1 + len(word) <= width:
+            line += " " + word
+            continue
+        if line:
+            lines.append(line.rstrip())
+            line = ""
+        # Like textwrap, whitespace at a break (newlines included) is dropped, not just spaces
+        word = word.lstrip()
+        if not word:
+            continue
+        while len(word) > width:
+            lines.append(word[:width])
+            word = word[width:]
+        line = word
+    if line:
+        lines.append(line.rstrip())
+    return lines
+
+def wrap_ansi(text, spans, width, highlight=True):
     s = text or ""
-    if highlight and supports_ansi():
-        s = matcher.sub(lambda m: f"{ANSI['yellow']}{ANSI['bold']}{m.group(0)}{ANSI['reset']}", s)
-    # If width==0, use terminal width; else use provided width
+    if highlight and _ANSI_OK and spans:
+        # Spans are precomputed per batch for both renderers; splicing them here is cheaper
+        # than a second regex pass with a substitution template
+        parts, pos = [], 0
+        for start, end in spans:
+            parts.append(s[pos:start])
+            parts.append(_ANSI_KEYWORD_ON + s[start:end] + ANSI["reset"])
+            pos = end
+        parts.append(s[pos:])
+        s = "".join(parts)
+    return wrap_words(s, width)
+
+def show_record_ansi(idx, x, total, doc_type, title, abstract, spans, width, use_colors):
+    bright = ANSI if (use_colors and _ANSI_OK) else {k:"" for k in ANSI}
+    # If width==0, use terminal width (looked up once per row); else use provided width
+    wrap_width = width
     if not width or width <= 0:
-        width = max(40, shutil.get_terminal_size(fallback=(120, 25)).columns - 4)
-    return textwrap.wrap(s, width=width, replace_whitespace=False)
-
-def show_record_ansi(idx, x, total, doc_type, title, abstract, matcher, width, use_colors):
-    bright = ANSI if (use_colors and supports_ansi()) else {k:"" for k in ANSI}
-    print(f"{bright['bold']}{bright['cyan']}==== Row #{idx} • Progress: [{x} / {total}] ===={bright['reset']}")
-    print(f"{bright['bold']}{bright['cyan']}Document Type:{bright['reset']}")
-    for line in wrap_ansi(doc_type, matcher, width, highlight=use_colors):
-        print("  " + line)
-    print(f"\n{bright['bold']}{bright['cyan']}Article Title:{bright['reset']}")
-    for line in wrap_ansi(title, matcher, width, highlight=use_colors):
-        print("  " + line)
-    print(f"\n{bright['bold']}{bright['cyan']}Abstract:{bright['reset']}")
-    for line in wrap_ansi(abstract, matcher, width, highlight=use_colors):
-        print("  " + line)
-    print(bright["dim"] + "-" * max(40, min(200, width or 120)) + bright["reset"])
+        wrap_width = max(40, shutil.get_terminal_size(fallback=(120, 25)).columns - 4)
+    # Build the whole record first and write it once, instead of one print() per line
+    out = [f"{bright['bold']}{bright['cyan']}==== Row #{idx} • Progress: [{x} / {total}] ===={bright['reset']}"]
+    out.append(f"{bright['bold']}{bright['cyan']}Document Type:{bright['reset']}")
+    dt_spans, tt_spans, ab_spans = spans
+    out.extend("  " + line for line in wrap_ansi(doc_type, dt_spans, wrap_width, highlight=use_colors))
+    out.append(f"\n{bright['bold']}{bright['cyan']}Article Title:{bright['reset']}")
+    out.extend("  " + line for line in wrap_ansi(title, tt_spans, wrap_width, highlight=use_colors))
+    out.append(f"\n{bright['bold']}{bright['cyan']}Abstract:{bright['reset']}")
+    out.extend("  " + line for line in wrap_ansi(abstract, ab_spans, wrap_width, highlight=use_colors))
+    out.append(bright["dim"] + "-" * max(40, min(200, width or 120)) + bright["reset"])
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
 
 def prompt_choice_ansi():
     while True:
@@ -247,6 +700,8 @@ def main():
                         help="Rebuild the working copy from input (overwrites existing).")
     parser.add_argument("-k", "--keyword", action="append", default=[],
                         help="Add a keyword/phrase (use '*' as wildcard, repeatable).")
+    parser.add_argument("--regex-engine", choices=list(ENGINE_PACKAGES), default="re",
+                        help="Regex engine for keyword matching: re (stdlib), regex or re2 (optional installs).")
     parser.add_argument("--encoding", default="utf-8", help="CSV encoding (default: utf-8).")
     parser.add_argument("--width", type=int, default=0,
                         help="Max panel/line width (0 = auto full terminal width).")
@@ -258,24 +713,86 @@ def main():
                         help="Force color even if not detected as a TTY.")
     parser.add_argument("--pager", action="store_true",
                         help="Show each paper inside a scrollable pager (no truncation).")
+    parser.add_argument("--durable", action="store_true",
+                        help="fsync the decision journal after every decision and the working copy "
+                             "before the journal is dropped (slower, survives power loss).")
+    parser.add_argument("--auto-exclude-doctype", default="",
+                        help="Comma-separated TYPE:REASON pairs to exclude without asking, "
+                             "e.g. 'Review:2,Letter:1' (reason codes as in the prompt).")
+    parser.add_argument("--auto-include-if-all-keywords-match", action="store_true",
+                        help="Include without asking when title/abstract match every -k keyword.")
     parser.add_argument("--redo-completed", action="store_true",
                         help="Also revisit rows that already have decisions.")
     args = parser.parse_args()
 
-    fieldnames, rows = init_or_load_work(
+    # Build the keyword patterns and check the auto-decision flags before any file is
+    # created or rewritten (a missing --regex-engine package exits here)
+    matcher, defaults, user_terms = build_keyword_patterns(args.keyword, args.regex_engine)
+    min_len = min_keyword_length(defaults + user_terms)
+    exclude_doctypes = {}
+    for item in args.auto_exclude_doctype.split(","):
+        if not item.strip():
+            continue
+        doc_type, _, code = item.rpartition(":")
+        if not doc_type.strip() or code.strip() not in REASONS:
+            raise SystemExit(
+                f"ERROR: --auto-exclude-doctype entry '{item.strip()}' needs a reason code, e.g. 'Review:2'.\n"
+                "Codes: " + ", ".join(f"{k}={v}" for k, v in REASONS.items())
+            )
+        exclude_doctypes[doc_type.strip().lower()] = REASONS[code.strip()]
+    must_have = []
+    if args.auto_include_if_all_keywords_match:
+        terms = [t.strip() for t in args.keyword if t.strip()]
+        if not terms:
+            raise SystemExit("ERROR: --auto-include-if-all-keywords-match needs at least one -k keyword.")
+        must_have = [compile_pattern(f"(?i){_term_pattern(t)}", args.regex_engine) for t in terms]
+
+    fieldnames = init_or_load_work(
         args.csv_path, args.work, args.encoding, from_scratch=args.from_scratch
     )
 
-    matcher, defaults, user_terms = build_keyword_patterns(args.keyword)
+    # Decisions are appended to a journal; the working copy is rewritten once on exit
+    jpath = journal_path(args.work)
+    if not args.from_scratch:
+        recovered = replay_journal(jpath, args.encoding)
+        if recovered:
+            rewrite_work(args.work, fieldnames, recovered, args.encoding, args.durable)
+            print(f"Recovered {len(recovered)} decision(s) from {jpath}")
+    rows = WorkRows(args.work, args.encoding)
+
+    # Settle obvious undecided rows in one bulk rewrite, before anything is prompted for
+    if exclude_doctypes or must_have:
+        auto = auto_decide(rows, rows.undecided, exclude_doctypes, must_have)
+        if auto:
+            rows.close()
+            rewrite_work(args.work, fieldnames, auto, args.encoding, args.durable)
+            rows = WorkRows(args.work, args.encoding)
+        excluded = sum(1 for inc, _ in auto.values() if inc == "no")
+        print(f"Auto-decided {len(auto)} row(s): {excluded} excluded by document type, "
+              f"{len(auto) - excluded} included by keywords")
+    decisions = {}
+    jfile, journal = open_journal(jpath, args.encoding)
+
+    def save_work():
+        if jfile.closed:
+            return
+        jfile.close()
+        rows.close()
+        if decisions:
+            # The journal is the only durable copy until the rewritten working copy is on disk
+            rewrite_work(args.work, fieldnames, decisions, args.encoding, args.durable)
+        os.remove(jpath)
+    atexit.register(save_work)
+
 
     total = len(rows)
-    indices = range(total)
-    if not args.redo_completed:
-        indices = [i for i, r in enumerate(rows) if (r.get("include", "").strip() not in {"yes", "no"})]
-    decided_so_far = sum(1 for r in rows if (r.get("include", "").strip() in {"yes", "no"}))
+    indices = range(total) if args.redo_completed else rows.undecided
+    decided_so_far = total - len(rows.undecided)
+    batch = {}
 
     use_rich = HAVE_RICH and not args.no_color and (args.force_color or sys.stdout.isatty())
     console = make_console(args.theme) if use_rich else None
+    use_rich = console is not None
 
     # Banner
     if use_rich:
@@ -285,46 +802,47 @@ def main():
             console.print(f"[label]User[/]: " + ", ".join(user_terms))
         console.print("[dim](Keywords shown in [keyword]bold yellow[/]. Use --theme to change.)[/]\n")
     else:
-        if not args.no_color and supports_ansi():
-            print(f"{ANSI['cyan']}{ANSI['bold']}Keyword highlighting{ANSI['reset']}")
-        print("Default: " + ", ".join(defaults))
+        banner = []
+        if not args.no_color and _ANSI_OK:
+            banner.append(f"{ANSI['cyan']}{ANSI['bold']}Keyword highlighting{ANSI['reset']}")
+        banner.append("Default: " + ", ".join(defaults))
         if user_terms:
-            print("User: " + ", ".join(user_terms))
-        print()
+            banner.append("User: " + ", ".join(user_terms))
+        sys.stdout.write("\n".join(banner) + "\n\n")
+        sys.stdout.flush()
 
-    for idx in indices:
-        r = rows[idx]
-        x = decided_so_far + 1 if r.get("include", "").strip() not in {"yes", "no"} else decided_so_far
+    for n, idx in enumerate(indices):
+        if idx not in batch:
+            # Rows are read and matched here, a batch of upcoming ones at a time; rendering only applies spans
+            batch = precompute_spans(rows, indices[n:n + SPAN_BATCH], matcher, min_len)
+        r, flat = batch[idx]
+        decided = rows.status[idx] != UNDECIDED
+        x = decided_so_far + (0 if decided else 1)
 
-        doc_type = r.get("Document Type", "") or ""
-        title = r.get("Article Title", "") or ""
-        abstract = r.get("Abstract", "") or ""
+        doc_type, title, abstract = (r.get(c, "") or "" for c in REQUIRED_COLUMNS)
+        spans = unpack_spans(flat)
 
         # Show record (no truncation)
         if use_rich:
             if args.pager:
                 with console.pager(styles=True):
-                    show_record_rich(console, idx, x, total, doc_type, title, abstract, matcher, args.width)
+                    show_record_rich(console, idx, x, total, doc_type, title, abstract, spans, args.width)
             else:
-                show_record_rich(console, idx, x, total, doc_type, title, abstract, matcher, args.width)
+                show_record_rich(console, idx, x, total, doc_type, title, abstract, spans, args.width)
 
-            existing = r.get("include", "").strip()
-            if existing in {"yes", "no"} and args.redo_completed:
-                console.print(f"[dim](already decided: include={existing}, reason={r.get('reason','')})[/]")
+            if decided:
+                console.print(f"[dim](already decided: include={r['include'].strip()}, reason={r['reason']})[/]")
             choice = prompt_choice_rich(console)
         else:
-            show_record_ansi(idx, x, total, doc_type, title, abstract, matcher, args.width, use_colors=(not args.no_color))
-            existing = r.get("include", "").strip()
-            if existing in {"yes", "no"} and args.redo_completed:
-                print(f"(already decided: include={existing}, reason={r.get('reason','')})")
+            show_record_ansi(idx, x, total, doc_type, title, abstract, spans, args.width, use_colors=(not args.no_color))
+            if decided:
+                print(f"(already decided: include={r['include'].strip()}, reason={r['reason']})")
             choice = prompt_choice_ansi()
 
         changed = False
         if choice == "i":
             r["include"] = "yes"
             r["reason"] = ""
-            if existing not in {"yes", "no"}:
-                decided_so_far += 1
             changed = True
             if use_rich: console.print("[good]Included[/]")
             else: print(f"{ANSI['green']}Included{ANSI['reset']}")
@@ -332,8 +850,6 @@ def main():
             reason = prompt_reason_rich(console) if use_rich else prompt_reason_ansi()
             r["include"] = "no"
             r["reason"] = reason
-            if existing not in {"yes", "no"}:
-                decided_so_far += 1
             changed = True
             if use_rich: console.print(f"[bad]Excluded[/] ([label]reason[/]: {reason})")
             else: print(f"{ANSI['red']}Excluded{ANSI['reset']} (reason: {reason})")
@@ -345,13 +861,21 @@ def main():
             break
 
         if changed:
-            write_csv(args.work, fieldnames, rows, args.encoding)
-            ts = datetime.utcnow().isoformat(timespec="seconds") + "Z"
+            if not decided:
+                decided_so_far += 1
+            rows.status[idx] = DECIDED_CODES[r["include"]]
+            ts = utc_timestamp()
+            decisions[idx] = (r["include"], r["reason"])
+            journal.writerow([idx, r["include"], r["reason"], ts])
+            jfile.flush()
+            if args.durable:
+                os.fsync(jfile.fileno())
             if use_rich:
-                console.print(f"[dim]Saved to {args.work} at {ts}[/]")
+                console.print(f"[dim]Saved to {jpath} at {ts}[/]")
             else:
-                print(f"Saved to {args.work} at {ts}")
+                print(f"Saved to {jpath} at {ts}")
 
+    save_work()
     if use_rich:
         console.rule("[hdr]Done[/]")
     else: